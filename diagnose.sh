@@ -41,10 +41,17 @@ echo ""
 
 # Check SPI
 echo "🔌 SPI status:"
-if lsmod | grep -q spi_bcm2835; then
+if [ "$GPIO_PIN" -eq 10 ]; then
+    if lsmod | grep -q spi_bcm2835; then
+        echo "   ✅ SPI module loaded (required for GPIO 10)"
+    else
+        echo "   ❌ SPI module not loaded - required for GPIO 10!"
+        echo "   💡 Fix: sudo raspi-config → Interface Options → SPI"
+    fi
+elif lsmod | grep -q spi_bcm2835; then
     echo "   ℹ️  SPI module loaded"
 else
-    echo "   ℹ️  SPI module not loaded (not needed for WS281x)"
+    echo "   ℹ️  SPI module not loaded (only needed for GPIO 10)"
 fi
 echo ""
 
@@ -73,6 +80,13 @@ else
     echo "   💡 Fix: source venv/bin/activate && pip install adafruit-circuitpython-neopixel"
 fi
 
+# Check rpi_ws281x (optional driver)
+if venv/bin/python -c "import rpi_ws281x" 2>/dev/null; then
+    echo "   ✅ rpi_ws281x is installed"
+else
+    echo "   ℹ️  rpi_ws281x is not installed (only needed for \"driver\": \"rpi_ws281x\")"
+fi
+
 # Check pygame
 if venv/bin/python -c "import pygame" 2>/dev/null; then
     echo "   ✅ pygame is installed"
@@ -107,6 +121,9 @@ echo "   • GPIO 13 (PWM1) - no audio conflict"
 echo "   • GPIO 18 (PWM0) - requires audio=off on Pi 4/5"
 echo "   • GPIO 21 (PWM1) - no audio conflict"
 echo ""
+echo "   SPI pin:"
+echo "   • GPIO 10 (SPI0 MOSI) - DMA transfer, requires SPI enabled"
+echo ""
 echo "   💡 Change pin in config.json: \"pin\": 12"
 echo ""
 
@@ -6,12 +6,133 @@ Supports 1-4 players co-op
 
 import time
 import random
+import bisect
 import signal
 import sys
 import pygame
-import board
-import neopixel
 import json
+import atexit
+import logging
+import logging.handlers
+import queue
+import os
+import threading
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+class WS281xStrip:
+    """NeoPixel-style wrapper around rpi_ws281x, for the parts of the strip API the game uses"""
+
+    # GPIO 13 is on the second PWM channel, the other pins use channel 0
+    CHANNEL_1_PINS = (13,)
+
+    def __init__(self, gpio_pin, count):
+        from rpi_ws281x import PixelStrip
+
+        channel = 1 if gpio_pin in self.CHANNEL_1_PINS else 0
+        # Colors are pre-scaled by the game, so the driver runs at full brightness
+        self._strip = PixelStrip(count, gpio_pin, brightness=255, channel=channel)
+        self._strip.begin()
+        self._set_pixel = self._strip.setPixelColor
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __setitem__(self, index, colors):
+        """Set a slice of pixels from a list of (r, g, b) rows"""
+        set_pixel = self._set_pixel
+        start, stop, step = index.indices(self._count)
+        for i, (r, g, b) in zip(range(start, stop, step), colors):
+            set_pixel(i, (r << 16) | (g << 8) | b)
+
+    def fill(self, color):
+        """Set every pixel to one (r, g, b) color"""
+        self[:] = [color] * self._count
+
+    def show(self):
+        """Send the pixels to the strip"""
+        self._strip.show()
+
+
+def setup_logging():
+    """Return the game logger, writing to stdout from a background thread"""
+    log = logging.getLogger('led_runner')
+
+    if not log.handlers:
+        # Console writes can stall for a while, keep them out of the game loop
+        log_queue = queue.SimpleQueue()
+        log.addHandler(logging.handlers.QueueHandler(log_queue))
+        log.setLevel(logging.INFO)
+        log.propagate = False
+
+        listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+        listener.start()
+        atexit.register(listener.stop)
+
+    return log
+
+
+# Obstacle kernels. Obstacles are stored in spawn order and move together,
+# so positions are ascending and only a leading run can leave the strip.
+# The loop versions are compiled with numba when it is installed, otherwise
+# the numpy versions below are used.
+
+def tick_obstacles(pos, n, player_pos):
+    """Move obstacles one step, return (number that left the strip, index at player or -1)"""
+    num_left = 0
+    hit = -1
+    for i in range(n):
+        pos[i] -= 1
+        if pos[i] < 0:
+            num_left = i + 1
+        elif pos[i] == player_pos:
+            hit = i
+    return num_left, hit
+
+
+def compact_obstacles(pos, color, button, player, color_idx, start, n):
+    """Move obstacles start..n-1 to the front of every column, return the new count"""
+    kept = n - start
+    for w in range(kept):
+        r = start + w
+        pos[w] = pos[r]
+        color[w, :] = color[r, :]
+        button[w] = button[r]
+        player[w] = player[r]
+        color_idx[w] = color_idx[r]
+    return kept
+
+
+def tick_obstacles_numpy(pos, n, player_pos):
+    """numpy version of tick_obstacles"""
+    moved = pos[:n]
+    moved -= 1
+    num_left, hit = (int(idx) for idx in np.searchsorted(moved, (0, player_pos)))
+    if hit == n or moved[hit] != player_pos:
+        hit = -1
+    return num_left, hit
+
+
+def compact_obstacles_numpy(pos, color, button, player, color_idx, start, n):
+    """numpy version of compact_obstacles"""
+    kept = n - start
+    for column in (pos, color, button, player, color_idx):
+        column[:kept] = column[start:n]
+    return kept
+
+
+if njit is not None:
+    tick_obstacles = njit(cache=True)(tick_obstacles)
+    compact_obstacles = njit(cache=True)(compact_obstacles)
+else:
+    tick_obstacles = tick_obstacles_numpy
+    compact_obstacles = compact_obstacles_numpy
 
 
 class LEDGame:
@@ -19,70 +140,179 @@ class LEDGame:
     STATE_PLAYING = 'playing'
     STATE_PAUSED = 'paused'
     STATE_GAME_OVER = 'game_over'
+    STATE_ANIMATING = 'animating'
+
+    # Pause blink phase length
+    BLINK_NS = 500_000_000
+
+    # Most ticks run back to back when the loop fell behind
+    MAX_CATCH_UP_TICKS = 8
+
+    # Posted to wake up the main loop when a signal arrives
+    WAKEUP_EVENT = pygame.USEREVENT
+
+    # Event types fetched by handle_input
+    INPUT_EVENTS = [pygame.JOYBUTTONDOWN, pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED, pygame.QUIT]
+
+    # Supported LED drivers, the first one is the default
+    LED_DRIVERS = ('neopixel', 'rpi_ws281x')
+
+    # PWM/PCM data pins, GPIO 10 (SPI0 MOSI) drives the strip through the SPI peripheral
+    PWM_PINS = (12, 13, 18, 21)
+    SPI_PIN = 10
+
+    # Obstacle colors in unlock order
+    COLOR_TIERS = (
+        ('yellow',),
+        ('yellow', 'red'),
+        ('yellow', 'red', 'green'),
+        ('yellow', 'red', 'green', 'blue'),
+    )
+
+    # Highest score of each of the first levels, after that a level every LEVEL_SCORE_STEP points
+    LEVEL_MAX_SCORES = (2, 5, 9, 14, 20)
+    LEVEL_SCORE_STEP = 8
+
+    # Scores that unlock the next color tier, per player count
+    COLOR_UNLOCK_SCORES = {
+        1: (6, 12, 18),
+        2: (3, 6),
+        3: (6,),
+        4: (),
+    }
 
     def __init__(self, config_file="config.json"):
         """Initialize the game with configuration"""
+        self.log = setup_logging()
+
         # Load configuration
         with open(config_file, 'r') as f:
             config = json.load(f)
 
-        self.led_config = config['led']
-        self.game_config = config['game']
+        # Config values are read into attributes here, nothing reads the dicts later
+        led_config = config['led']
+        game_config = config['game']
+        buttons = game_config['buttons']
+        self._count = int(led_config['count'])
 
-        # GPIO pin mapping
-        gpio_map = {
-            12: board.D12,
-            13: board.D13,
-            18: board.D18,
-            21: board.D21
-        }
+        # Brightness is applied to every color up front, the strip itself
+        # runs at full brightness so show() doesn't rescale each frame
+        self._brightness = led_config['brightness'] / 255.0
 
-        gpio_pin = self.led_config.get('pin', 18)
-        if gpio_pin not in gpio_map:
-            print(f"❌ Invalid GPIO pin: {gpio_pin}")
-            print(f"   Use: 12, 13, 18 or 21")
+        driver = led_config.get('driver', self.LED_DRIVERS[0])
+        if driver not in self.LED_DRIVERS:
+            self.log.error(f"❌ Invalid LED driver: {driver}")
+            self.log.error(f"   Use: {', '.join(self.LED_DRIVERS)}")
+            exit(1)
+
+        gpio_pin = led_config.get('pin', 18)
+        if gpio_pin not in self.PWM_PINS and gpio_pin != self.SPI_PIN:
+            self.log.error(f"❌ Invalid GPIO pin: {gpio_pin}")
+            self.log.error(f"   Use: 10 (SPI), 12, 13, 18 or 21")
             exit(1)
 
         # Setup LED strip
         try:
-            self.strip = neopixel.NeoPixel(
-                gpio_map[gpio_pin],
-                self.led_config['count'],
-                brightness=self.led_config['brightness'] / 255.0,
-                auto_write=False,
-                pixel_order=neopixel.GRB
-            )
+            self.strip = self.open_strip(driver, gpio_pin)
+        except ImportError as e:
+            self.log.error(f"❌ LED driver '{driver}' is not installed: {e}")
+            exit(1)
         except Exception as e:
-            print(f"❌ Error initializing LED strip: {e}")
-            print(f"   Are you running the script with sudo?")
+            self.log.error(f"❌ Error initializing LED strip: {e}")
+            if gpio_pin == self.SPI_PIN:
+                self.log.error(f"   Is SPI enabled? (sudo raspi-config → Interface Options → SPI)")
+            else:
+                self.log.error(f"   Are you running the script with sudo?")
             exit(1)
 
+        # Frame buffer (one RGB row per LED), pushed to the strip in one go
+        self._buf = np.zeros((self._count, 3), dtype=np.uint8)
+        self._last_buf = np.zeros_like(self._buf)
+        self._buf_view = memoryview(self._buf)
+        self._last_buf_view = memoryview(self._last_buf)
+        self._digit_tiles = self.build_digit_tiles()
+
+        self._strip_show = self.strip.show
+
+        # Direct views on the strip's pixel bytes, None if the driver hides them
+        self._strip_view = self.bind_strip_view()
+
+        # A worker thread owns the strip and sends the newest posted frame,
+        # so the game never waits for a transfer to finish
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._show_thread = threading.Thread(target=self.show_loop, name='led-show', daemon=True)
+        self._show_thread.start()
+
+        # Random source for obstacle colors
+        self._rng = random.Random()
+
         # Setup pygame
         pygame.init()
 
+        # Only the event types we handle may enter the queue, SDL drops the
+        # rest (stick and d-pad motion, releases, mouse, window, audio...)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.INPUT_EVENTS + [self.WAKEUP_EVENT])
+
         # Start button
-        self.start_button = self.game_config['buttons'].get('start', 9)
+        self.start_button = buttons.get('start', 9)
 
         # Base color definitions
         self.color_defs = {
-            'yellow': {'rgb': (255, 255, 0), 'button': self.game_config['buttons']['yellow']},
-            'red': {'rgb': (255, 0, 0), 'button': self.game_config['buttons']['red']},
-            'green': {'rgb': (0, 150, 0), 'button': self.game_config['buttons']['green']},
-            'blue': {'rgb': (0, 0, 255), 'button': self.game_config['buttons']['blue']}
+            'yellow': {'rgb': (255, 255, 0), 'button': buttons['yellow']},
+            'red': {'rgb': (255, 0, 0), 'button': buttons['red']},
+            'green': {'rgb': (0, 150, 0), 'button': buttons['green']},
+            'blue': {'rgb': (0, 0, 255), 'button': buttons['blue']}
         }
 
+        # Fixed color order, obstacles refer to colors by index
+        self._color_names = tuple(self.color_defs)
+        self._color_labels = tuple(color_name.upper() for color_name in self._color_names)
+
+        # Obstacle storage as parallel arrays (struct-of-arrays).
+        # Obstacles are at least 3 LEDs apart, so this capacity is never exceeded.
+        capacity = self._count // 3 + 2
+        self._obs_pos = np.zeros(capacity, dtype=np.int16)
+        self._obs_color = np.zeros((capacity, 3), dtype=np.uint8)
+        self._obs_button = np.zeros(capacity, dtype=np.int8)
+        self._obs_player = np.zeros(capacity, dtype=np.int8)
+        self._obs_color_idx = np.zeros(capacity, dtype=np.int8)
+        self._obs_n = 0
+
+        # Compile (or load from cache) the kernels now rather than on the first tick
+        tick_obstacles(self._obs_pos, 0, 0)
+        compact_obstacles(
+            self._obs_pos, self._obs_color, self._obs_button,
+            self._obs_player, self._obs_color_idx, 0, 0
+        )
+
+        # Button presses as a (player, button) grid: expiry deadline in
+        # monotonic ns and whether the button counts as held at this tick
+        num_buttons = max(color_def['button'] for color_def in self.color_defs.values()) + 1
+        self._press_expiry = np.zeros((4, num_buttons), dtype=np.int64)
+        self.pressed_buttons = np.zeros((4, num_buttons), dtype=bool)
+
         # Detect controllers (will exit if none found)
         self.joysticks = []
         self.num_players = 0
         self.colors = {}
+        self._controllers_changed = False
         self.detect_controllers(initial=True)
 
-        # Cache player color (white)
-        self.player_color = (
-            self.game_config['player_color']['r'],
-            self.game_config['player_color']['g'],
-            self.game_config['player_color']['b']
-        )
+        # Cache player (white) and game over colors
+        self.player_color = self.scale_color((
+            game_config['player_color']['r'],
+            game_config['player_color']['g'],
+            game_config['player_color']['b']
+        ))
+        self.fail_color = self.scale_color((
+            game_config['fail_color']['r'],
+            game_config['fail_color']['g'],
+            game_config['fail_color']['b']
+        ))
+
+        # Per-frame render bound to the buffers above
+        self.update_display = self.build_update_display()
 
         # Initialize game
         self.running = True
@@ -91,6 +321,10 @@ class LEDGame:
 
     def detect_controllers(self, initial=False):
         """Detect and initialize controllers"""
+        # Re-enumerating reopens every device, skip it when nothing was plugged in or out
+        if not initial and not self._controllers_changed and min(pygame.joystick.get_count(), 4) == len(self.joysticks):
+            return True
+
         # Quit existing joysticks
         for js in self.joysticks:
             js.quit()
@@ -98,15 +332,19 @@ class LEDGame:
         # Re-init joystick module to detect changes
         pygame.joystick.quit()
         pygame.joystick.init()
+        # SDL reports every connected device as added again on init, those
+        # aren't hotplugs and must not force the next restart to re-enumerate
+        pygame.event.clear([pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED])
+        self._controllers_changed = False
 
         num_joysticks = pygame.joystick.get_count()
 
         if num_joysticks == 0:
             if initial:
-                print("⚠️  No controller found! Connect a controller.")
+                self.log.warning("⚠️  No controller found! Connect a controller.")
                 exit(1)
             else:
-                print("⚠️  No controller found! Connect a controller and press START.")
+                self.log.warning("⚠️  No controller found! Connect a controller and press START.")
                 return False
 
         # Initialize all connected controllers (max 4)
@@ -116,13 +354,14 @@ class LEDGame:
             js = pygame.joystick.Joystick(i)
             js.init()
             self.joysticks.append(js)
-            print(f"🎮 Controller {i + 1}: {js.get_name()}")
+            self.log.info(f"🎮 Controller {i + 1}: {js.get_name()}")
 
         # Update player count
         self.num_players = len(self.joysticks)
 
         # Reassign colors
         self.colors = self.assign_colors_to_players()
+        self.build_color_tables()
 
         # Print mode info if changed or initial
         if initial or self.num_players != old_num_players:
@@ -163,98 +402,264 @@ class LEDGame:
 
         return colors
 
+    def build_color_tables(self):
+        """Build lookup tables for the current color assignment"""
+        # Obstacle template per color: (rgb, button, player, color index)
+        self._color_templates = {}
+        # Color button -> (required player, label)
+        self._button_table = {}
+
+        for idx, color_name in enumerate(self._color_names):
+            color_data = self.colors[color_name]
+            self._color_templates[color_name] = (
+                self.scale_color(color_data['rgb']), color_data['button'], color_data['player'], idx
+            )
+            self._button_table[color_data['button']] = (color_data['player'], self._color_labels[idx])
+
+        # Score -> announcement of the color it unlocks
+        self._color_announcements = {}
+        unlock_scores = self.COLOR_UNLOCK_SCORES[self.num_players]
+        for tier, score in enumerate(unlock_scores, len(self.COLOR_TIERS) - len(unlock_scores)):
+            color_name = self.COLOR_TIERS[tier][-1]
+            if self.num_players == 1:
+                self._color_announcements[score] = f"🎨 +{color_name.capitalize()}!"
+            else:
+                player = self.colors[color_name]['player']
+                self._color_announcements[score] = f"🎨 +{color_name.capitalize()} (P{player + 1})!"
+
     def print_mode_info(self):
         """Print game mode information"""
         if self.num_players == 1:
-            print("\n👤 Single player mode")
-            print("   (Connect more controllers for co-op)")
+            self.log.info("\n👤 Single player mode")
+            self.log.info("   (Connect more controllers for co-op)")
         elif self.num_players == 2:
-            print("\n👥 Co-op mode (2 players)")
-            print("   P1: 🟡 Yellow + 🟢 Green")
-            print("   P2: 🔴 Red + 🔵 Blue")
+            self.log.info("\n👥 Co-op mode (2 players)")
+            self.log.info("   P1: 🟡 Yellow + 🟢 Green")
+            self.log.info("   P2: 🔴 Red + 🔵 Blue")
         elif self.num_players == 3:
-            print("\n👥 Co-op mode (3 players)")
-            print("   P1: 🟡 Yellow")
-            print("   P2: 🔴 Red")
-            print("   P3: 🟢 Green + 🔵 Blue")
+            self.log.info("\n👥 Co-op mode (3 players)")
+            self.log.info("   P1: 🟡 Yellow")
+            self.log.info("   P2: 🔴 Red")
+            self.log.info("   P3: 🟢 Green + 🔵 Blue")
         else:
-            print("\n👥 Co-op mode (4 players)")
-            print("   P1: 🟡 Yellow")
-            print("   P2: 🔴 Red")
-            print("   P3: 🟢 Green")
-            print("   P4: 🔵 Blue")
+            self.log.info("\n👥 Co-op mode (4 players)")
+            self.log.info("   P1: 🟡 Yellow")
+            self.log.info("   P2: 🔴 Red")
+            self.log.info("   P3: 🟢 Green")
+            self.log.info("   P4: 🔵 Blue")
 
     def reset_game(self):
         """Reset all game variables for a new game"""
-        self.player_pos = self.led_config['count'] // 2
-        self.obstacles = []
+        self.player_pos = self._count // 2
+        self._obs_n = 0
         self.score = 0
-        self.pressed_buttons = {}
+        self._press_expiry.fill(0)
+        self.pressed_buttons.fill(False)
         self.button_duration = 1.0
+        self._button_duration_ns = int(self.button_duration * 1e9)
         self.obstacles_passed = 0
         self.current_difficulty = 1
-        self.spawn_interval = self.led_config['count'] // 2
-        self.next_spawn_at = self.led_config['count'] - 1
+        self.spawn_interval = self._count // 2
+        self.next_spawn_at = self._count - 1
+        # Color index of every dodged obstacle, see self._color_names
         self.color_history = []
+        self.update_spawn_templates()
         self.base_speed = 0.25
         self.current_speed = self.base_speed
-        self.last_update = time.time()
+        self._tick_ns = int(self.current_speed * 1e9)
+        self._next_tick_ns = time.monotonic_ns() + self._tick_ns
+        self._pause_start_ns = self._next_tick_ns
+        # Set whenever the game state changed and the frame needs redrawing
+        self._dirty = True
+
+    def open_strip(self, driver, gpio_pin):
+        """Create the strip object for the configured driver, importing only that driver"""
+        if driver == 'rpi_ws281x':
+            # Talks to the PWM/PCM/SPI hardware directly, without the Blinka stack
+            return WS281xStrip(gpio_pin, self._count)
+
+        import board
+
+        if gpio_pin == self.SPI_PIN:
+            # SPI transfers the data with DMA instead of bit-banging it
+            import neopixel_spi
+            return neopixel_spi.NeoPixel_SPI(
+                board.SPI(),
+                self._count,
+                brightness=1.0,
+                auto_write=False,
+                pixel_order=neopixel_spi.GRB
+            )
 
-    def update_display(self):
-        """Update the LED strip with current game state"""
-        self.strip.fill((0, 0, 0))
+        import neopixel
+        return neopixel.NeoPixel(
+            getattr(board, f"D{gpio_pin}"),
+            self._count,
+            brightness=1.0,
+            auto_write=False,
+            pixel_order=neopixel.GRB
+        )
 
-        for obs in self.obstacles:
-            if 0 <= obs['pos'] < self.led_config['count']:
-                self.strip[obs['pos']] = obs['color']
+    def bind_strip_view(self):
+        """Map the strip's pixel bytes as numpy arrays so frames skip per-pixel setitem"""
+        try:
+            offset = self.strip._offset
+            byteorder = self.strip._byteorder
+            post_buffer = self.strip._post_brightness_buffer
+            pre_buffer = self.strip._pre_brightness_buffer
+            brightness = float(self.strip.brightness)
+        except AttributeError:
+            return None
+
+        # Only plain 3 bytes per pixel RGB strips are laid out this way
+        if len(byteorder) != 3 or getattr(self.strip, '_dotstar_mode', False):
+            return None
+
+        # Colors are pre-scaled and the strip runs at full brightness, a strip
+        # that still rescales has to go through PixelBuf's own setitem
+        if pre_buffer is not None or brightness != 1.0:
+            return None
+
+        pixels = np.frombuffer(
+            post_buffer, dtype=np.uint8, count=self._count * 3, offset=offset
+        ).reshape(self._count, 3)
+
+        # byteorder[c] is the byte that holds RGB channel c, invert it for a gather
+        order = np.argsort(byteorder)
+
+        return pixels, order
+
+    def show_buffer(self):
+        """Post the frame buffer to the show thread, unless nothing changed"""
+        # memoryview comparison runs in C without allocating a mask
+        if self._buf_view == self._last_buf_view:
+            return
+
+        np.copyto(self._last_buf, self._buf)
+        self.post_frame(self._buf.copy())
+
+    def post_frame(self, frame):
+        """Hand a frame (or None to stop) to the show thread, replacing one it hasn't taken yet"""
+        try:
+            self._frame_queue.get_nowait()
+            self._frame_queue.task_done()
+        except queue.Empty:
+            pass
+        # Only this thread puts, so the slot is free now
+        self._frame_queue.put_nowait(frame)
+
+    def show_loop(self):
+        """Write posted frames to the strip and show them, until None is posted"""
+        while True:
+            frame = self._frame_queue.get()
+            try:
+                if frame is None:
+                    return
+                self.write_strip(frame)
+                self._strip_show()
+            finally:
+                self._frame_queue.task_done()
+
+    def write_strip(self, frame):
+        """Copy a frame into the strip's pixel buffer"""
+        if self._strip_view is not None:
+            # Write straight into PixelBuf's sent bytes, in strip byte order
+            pixels, order = self._strip_view
+            np.take(frame, order, axis=1, out=pixels)
+        else:
+            # Plain int lists unpack much faster in PixelBuf than numpy rows
+            self.strip[:] = frame.tolist()
 
-        if len(self.pressed_buttons) == 0:
-            self.strip[self.player_pos] = self.player_color
+    def draw_obstacles(self, dim_shift=0):
+        """Draw all obstacles into the frame buffer, dimmed by a right shift"""
+        n = self._obs_n
 
-        self.strip.show()
+        # Obstacles are culled every tick, so all stored ones are on the strip.
+        # The shift returns a new array, the stored colors are left untouched.
+        self._buf[self._obs_pos[:n]] = self._obs_color[:n] >> dim_shift
 
-    def show_pause_display(self):
-        """Show pause indicator - blinking game state"""
-        t = time.time()
-
-        if int(t * 2) % 2 == 0:
-            self.strip.fill((0, 0, 0))
-            for obs in self.obstacles:
-                if 0 <= obs['pos'] < self.led_config['count']:
-                    self.strip[obs['pos']] = obs['color']
-            self.strip[self.player_pos] = self.player_color
-        else:
-            self.strip.fill((0, 0, 0))
-            for obs in self.obstacles:
-                if 0 <= obs['pos'] < self.led_config['count']:
-                    r, g, b = obs['color']
-                    self.strip[obs['pos']] = (r // 4, g // 4, b // 4)
+    def build_update_display(self):
+        """Return update_display specialized for this strip's fixed buffers"""
+        buf = self._buf
+        obs_pos = self._obs_pos
+        obs_color = self._obs_color
+        player_color = self.player_color
+        pressed_buttons = self.pressed_buttons
 
-        self.strip.show()
+        def update_display():
+            """Render the current game state into the frame buffer"""
+            n = self._obs_n
+            buf.fill(0)
 
-    def show_animation(self, color, duration=1.0, blink_count=3):
-        """Show a blink animation on all LEDs"""
-        blink_duration = duration / (blink_count * 2)
-        anim_color = (color['r'], color['g'], color['b'])
+            # Obstacles are culled every tick, so all stored ones are on the strip
+            buf[obs_pos[:n]] = obs_color[:n]
 
-        for _ in range(blink_count):
-            self.strip.fill(anim_color)
-            self.strip.show()
-            time.sleep(blink_duration)
+            if not pressed_buttons.any():
+                buf[self.player_pos] = player_color
 
-            self.strip.fill((0, 0, 0))
-            self.strip.show()
-            time.sleep(blink_duration)
+            self._dirty = False
 
-    def show_score_digits(self):
-        """Show score as digits with color coding (10 LEDs per digit)"""
-        self.strip.fill((0, 0, 0))
+        return update_display
 
-        color_zero = (200, 0, 200)
-        digits = [int(d) for d in str(self.score)]
+    def build_pause_frames(self):
+        """Render both pause blink frames once, the game state doesn't move while paused"""
+        self._pause_frames = np.zeros((2, self._count, 3), dtype=np.uint8)
+        self._pause_phase = -1
 
-        total_leds = self.led_config['count']
-        max_digits = total_leds // 10
+        # Phase 0: the full game state
+        self._buf.fill(0)
+        self.draw_obstacles()
+        self._buf[self.player_pos] = self.player_color
+        np.copyto(self._pause_frames[0], self._buf)
+
+        # Phase 1: obstacles at a quarter brightness
+        self._buf.fill(0)
+        self.draw_obstacles(dim_shift=2)
+        np.copyto(self._pause_frames[1], self._buf)
+
+    def show_pause_display(self):
+        """Show pause indicator - blinking game state"""
+        # Toggle every 500 ms, starting with the full game state
+        phase = ((time.monotonic_ns() - self._pause_start_ns) // self.BLINK_NS) & 1
+        if phase == self._pause_phase:
+            return
+
+        self._pause_phase = phase
+        np.copyto(self._buf, self._pause_frames[phase])
+
+    def show_animation(self, color, duration, blink_count, on_done):
+        """Start a blink animation on all LEDs in a scaled RGB color, on_done is called when it ends"""
+        # Both blink frames are rendered once: even phases light all LEDs, odd phases are off
+        self._anim_frames = np.zeros((2, self._count, 3), dtype=np.uint8)
+        self._anim_frames[0] = color
+        self._anim_phase = 0
+        self._anim_phases = blink_count * 2
+        self._anim_phase_ns = int(duration / self._anim_phases * 1e9)
+        self._anim_next_ns = time.monotonic_ns()
+        self._anim_on_done = on_done
+        self.state = self.STATE_ANIMATING
+
+    def update_animation(self):
+        """Advance the blink animation when its next phase is due"""
+        if time.monotonic_ns() < self._anim_next_ns:
+            return
+
+        if self._anim_phase == self._anim_phases:
+            self._anim_on_done()
+            return
+
+        np.copyto(self._buf, self._anim_frames[self._anim_phase & 1])
+
+        self._anim_phase += 1
+        self._anim_next_ns += self._anim_phase_ns
+
+    def scale_color(self, rgb):
+        """Apply the configured brightness to an RGB color"""
+        return tuple(int(c * self._brightness) for c in rgb)
+
+    def build_digit_tiles(self):
+        """Precompute the 10-LED pattern of every digit in every palette color"""
+        color_zero = (200, 0, 200)
 
         colors_palette = [
             (255, 255, 0),
@@ -263,283 +668,343 @@ class LEDGame:
             (0, 0, 255),
         ]
 
-        for pos, digit in enumerate(digits):
-            if pos >= max_digits:
-                break
+        # tiles[palette index, digit] -> 10 RGB rows
+        tiles = np.zeros((len(colors_palette), 10, 10, 3), dtype=np.uint8)
+        for palette_idx, color in enumerate(colors_palette):
+            tiles[palette_idx, 0, ::2] = color_zero
+            for digit in range(1, 10):
+                tiles[palette_idx, digit, :digit] = color
 
-            start_led = pos * 10
+        # Same truncation as scale_color()
+        return (tiles * self._brightness).astype(np.uint8)
 
-            if digit == 0:
-                for i in range(10):
-                    led_idx = start_led + i
-                    if led_idx < total_leds and i % 2 == 0:
-                        self.strip[led_idx] = color_zero
-            else:
-                color_bright = colors_palette[pos % 4]
-                for i in range(10):
-                    led_idx = start_led + i
-                    if led_idx < total_leds and i < digit:
-                        self.strip[led_idx] = color_bright
+    def show_score_digits(self):
+        """Show score as digits with color coding (10 LEDs per digit)"""
+        self._buf.fill(0)
 
-        self.strip.show()
+        max_digits = self._count // 10
+        num_palettes = len(self._digit_tiles)
+
+        for pos, digit in enumerate(str(self.score)[:max_digits]):
+            start_led = pos * 10
+            self._buf[start_led:start_led + 10] = self._digit_tiles[pos % num_palettes, int(digit)]
 
-    def press_button(self, player_idx, button, color_name):
+    def press_button(self, player_idx, button):
         """Register button press for a specific player"""
-        key = (player_idx, button)
-        self.pressed_buttons[key] = time.time()
+        self._press_expiry[player_idx, button] = time.monotonic_ns() + self._button_duration_ns
+        self.pressed_buttons[player_idx, button] = True
+        self._dirty = True
 
+        label = self._button_table[button][1]
         if self.num_players > 1:
-            print(f"P{player_idx + 1} {color_name.upper()}!")
+            self.log.info(f"P{player_idx + 1} {label}!")
         else:
-            print(f"🎮 {color_name.upper()}!")
+            self.log.info(f"🎮 {label}!")
 
     def is_button_pressed(self, required_player, button):
         """Check if the correct player has the button pressed"""
-        if self.num_players == 1:
-            for (player_idx, btn), _ in self.pressed_buttons.items():
-                if btn == button:
-                    return True
-            return False
-
-        key = (required_player, button)
-        return key in self.pressed_buttons
+        # With one player every color belongs to player 0, and only the
+        # first controller is read, so this also covers single player mode
+        return self.pressed_buttons[required_player, button]
 
     def get_available_colors(self):
         """Return available colors based on score and player count"""
-        if self.num_players == 1:
-            # Single player: progressive unlock
-            if self.score >= 18:
-                return ['yellow', 'red', 'green', 'blue']
-            elif self.score >= 12:
-                return ['yellow', 'red', 'green']
-            elif self.score >= 6:
-                return ['yellow', 'red']
-            else:
-                return ['yellow']
-        elif self.num_players == 2:
-            # 2 players: P1=yellow+green, P2=red+blue (unlock order)
-            if self.score >= 6:
-                return ['yellow', 'red', 'green', 'blue']
-            elif self.score >= 3:
-                return ['yellow', 'red', 'green']
-            else:
-                return ['yellow', 'red']
-        elif self.num_players == 3:
-            # 3 players: start with 1 each, P3 gets second color later
-            if self.score >= 6:
-                return ['yellow', 'red', 'green', 'blue']
-            else:
-                return ['yellow', 'red', 'green']
-        else:
-            # 4 players: all colors from start
-            return ['yellow', 'red', 'green', 'blue']
+        # More players start at a higher tier, all tiers end with 4 colors
+        unlock_scores = self.COLOR_UNLOCK_SCORES[self.num_players]
+        first_tier = len(self.COLOR_TIERS) - 1 - len(unlock_scores)
+        return self.COLOR_TIERS[first_tier + bisect.bisect_right(unlock_scores, self.score)]
+
+    def update_spawn_templates(self):
+        """Cache the obstacle templates of the colors available at this score"""
+        self._spawn_templates = tuple(self._color_templates[color_name] for color_name in self.get_available_colors())
 
     def update_difficulty(self):
         """Update difficulty level based on score"""
-        if self.score <= 2:
-            new_difficulty = 1
-        elif self.score <= 5:
-            new_difficulty = 2
-        elif self.score <= 9:
-            new_difficulty = 3
-        elif self.score <= 14:
-            new_difficulty = 4
-        elif self.score <= 20:
-            new_difficulty = 5
+        last_max_score = self.LEVEL_MAX_SCORES[-1]
+        if self.score <= last_max_score:
+            new_difficulty = bisect.bisect_left(self.LEVEL_MAX_SCORES, self.score) + 1
         else:
-            new_difficulty = 5 + ((self.score - 20) // 8)
+            new_difficulty = len(self.LEVEL_MAX_SCORES) + (self.score - last_max_score) // self.LEVEL_SCORE_STEP
 
         if new_difficulty > self.current_difficulty:
             self.current_difficulty = new_difficulty
-            self.spawn_interval = max(3, self.led_config['count'] // self.current_difficulty)
+            self.spawn_interval = max(3, self._count // self.current_difficulty)
             self.current_speed = max(0.05, self.base_speed - (self.current_difficulty * 0.015))
+            self._tick_ns = int(self.current_speed * 1e9)
 
-            print(f"⚡ Level {self.current_difficulty}!")
+            self.log.info(f"⚡ Level {self.current_difficulty}!")
 
         # Announce new colors based on player count
-        available = self.get_available_colors()
-        if self.num_players == 1:
-            if len(available) == 2 and self.score == 6:
-                print(f"🎨 +Red!")
-            elif len(available) == 3 and self.score == 12:
-                print(f"🎨 +Green!")
-            elif len(available) == 4 and self.score == 18:
-                print(f"🎨 +Blue!")
-        elif self.num_players == 2:
-            if len(available) == 3 and self.score == 3:
-                print(f"🎨 +Green (P1)!")
-            elif len(available) == 4 and self.score == 6:
-                print(f"🎨 +Blue (P2)!")
-        elif self.num_players == 3:
-            if len(available) == 4 and self.score == 6:
-                print(f"🎨 +Blue (P3)!")
+        self.update_spawn_templates()
+        announcement = self._color_announcements.get(self.score)
+        if announcement:
+            self.log.info(announcement)
 
     def spawn_obstacle(self):
         """Spawn a new obstacle"""
-        spawn_pos = self.led_config['count'] - 1
+        spawn_pos = self._count - 1
+        n = self._obs_n
 
-        for obs in self.obstacles:
-            if obs['pos'] == spawn_pos:
-                return
+        # Obstacles are in spawn order, so only the newest can hold the spawn slot
+        if n == len(self._obs_pos) or (n > 0 and self._obs_pos[n - 1] == spawn_pos):
+            return
 
-        available_colors = self.get_available_colors()
-        color_name = random.choice(available_colors)
-        color_data = self.colors[color_name]
+        templates = self._spawn_templates
+        rgb, button, player, color_idx = templates[self._rng.randrange(len(templates))]
 
-        obstacle = {
-            'pos': spawn_pos,
-            'color': color_data['rgb'],
-            'button': color_data['button'],
-            'player': color_data['player'],
-            'color_name': color_name
-        }
+        self._obs_pos[n] = spawn_pos
+        self._obs_color[n] = rgb
+        self._obs_button[n] = button
+        self._obs_player[n] = player
+        self._obs_color_idx[n] = color_idx
+        self._obs_n = n + 1
 
-        self.obstacles.append(obstacle)
-        self.next_spawn_at = obstacle['pos'] - self.spawn_interval
+        self.next_spawn_at = spawn_pos - self.spawn_interval
 
     def game_over(self):
         """Handle game over"""
-        print(f"❌ Game Over! Score: {self.score}")
+        self.log.info(f"❌ Game Over! Score: {self.score}")
 
-        self.show_animation(self.game_config['fail_color'], 1.0, 3)
+        self.show_animation(self.fail_color, 1.0, 3, on_done=self.show_final_score)
 
-        print(f"\n{'='*40}")
-        print(f"🏆 FINAL SCORE: {self.score}")
-        print(f"{'='*40}")
-        print(f"\nPress START for new game...")
+    def show_final_score(self):
+        """Show the final score once the game over animation is done"""
+        self.log.info(f"\n{'='*40}")
+        self.log.info(f"🏆 FINAL SCORE: {self.score}")
+        self.log.info(f"{'='*40}")
+        self.log.info(f"\nPress START for new game...")
 
         self.show_score_digits()
         self.state = self.STATE_GAME_OVER
 
     def handle_input(self):
         """Process controller input from all players"""
-        pygame.event.pump()
-
-        for event in pygame.event.get():
-            if event.type == pygame.JOYBUTTONDOWN:
-                joy_id = event.joy
-
-                # Ignore controllers beyond player count
-                if joy_id >= self.num_players:
-                    continue
-
-                # Start button (any controller)
-                if event.button == self.start_button:
-                    if self.state == self.STATE_PLAYING:
-                        self.state = self.STATE_PAUSED
-                        print("\n⏸️  PAUSED")
-                    elif self.state == self.STATE_PAUSED:
-                        self.state = self.STATE_PLAYING
-                        self.last_update = time.time()
-                        print("\n▶️  RESUMED")
-                    elif self.state == self.STATE_GAME_OVER:
-                        # Re-detect controllers for new game
-                        print("\n🔄 Checking controllers...")
-                        self.detect_controllers()
-                        self.reset_game()
-                        self.state = self.STATE_PLAYING
-                        print("🎮 New game!")
-
-                # Color buttons (only when playing)
-                elif self.state == self.STATE_PLAYING:
-                    for color_name, color_data in self.colors.items():
-                        if event.button == color_data['button']:
-                            required_player = color_data['player']
-
-                            if self.num_players == 1:
-                                self.press_button(joy_id, event.button, color_name)
-                            elif joy_id == required_player:
-                                self.press_button(joy_id, event.button, color_name)
-                            break
+        # Only fetch the events we handle, other event types stay in SDL.
+        # wait_for_event() has already pumped SDL's queue.
+        handle_event = self.handle_event
+        for event in pygame.event.get(self.INPUT_EVENTS, pump=False):
+            handle_event(event)
+
+    def handle_event(self, event):
+        """Handle a single controller event, other event types are ignored"""
+        if event.type == pygame.QUIT:
+            self.running = False
+            return
+
+        # Controllers are re-detected on the next new game
+        if event.type in (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED):
+            self._controllers_changed = True
+            return
+
+        if event.type != pygame.JOYBUTTONDOWN:
+            return
+
+        joy_id = event.joy
+
+        # Ignore controllers beyond player count
+        if joy_id >= self.num_players:
+            return
+
+        # Start button (any controller)
+        if event.button == self.start_button:
+            if self.state == self.STATE_PLAYING:
+                self.state = self.STATE_PAUSED
+                self._pause_start_ns = time.monotonic_ns()
+                self.build_pause_frames()
+                self.log.info("\n⏸️  PAUSED")
+            elif self.state == self.STATE_PAUSED:
+                self.state = self.STATE_PLAYING
+                self._next_tick_ns = time.monotonic_ns() + self._tick_ns
+                self._dirty = True
+                self.log.info("\n▶️  RESUMED")
+            elif self.state == self.STATE_GAME_OVER:
+                # Re-detect controllers for new game
+                self.log.info("\n🔄 Checking controllers...")
+                self.detect_controllers()
+                self.reset_game()
+                self.state = self.STATE_PLAYING
+                self.log.info("🎮 New game!")
+
+        # Color buttons (only when playing)
+        elif self.state == self.STATE_PLAYING:
+            entry = self._button_table.get(event.button)
+            if entry is not None and (self.num_players == 1 or joy_id == entry[0]):
+                self.press_button(joy_id, event.button)
 
     def update_obstacles(self):
         """Move all obstacles and check collision"""
-        current_time = time.time()
-        expired = [key for key, press_time in self.pressed_buttons.items()
-                   if current_time - press_time > self.button_duration]
-        for key in expired:
-            del self.pressed_buttons[key]
+        # Expire button presses in place, without allocating
+        np.greater_equal(self._press_expiry, time.monotonic_ns(), out=self.pressed_buttons)
+        self._dirty = True
 
-        for obs in self.obstacles:
-            obs['pos'] -= 1
+        n = self._obs_n
+        obstacles_passed, i = tick_obstacles(self._obs_pos, n, self.player_pos)
 
-        if len(self.obstacles) == 0 or self.obstacles[-1]['pos'] <= self.next_spawn_at:
+        if n == 0 or self._obs_pos[n - 1] <= self.next_spawn_at:
             self.spawn_obstacle()
-
-        for obs in self.obstacles[:]:
-            if obs['pos'] == self.player_pos:
-                required_player = obs['player']
-                if self.is_button_pressed(required_player, obs['button']):
-                    if self.num_players > 1:
-                        print(f"✅ P{required_player + 1} {obs['color_name'].upper()}")
-                    else:
-                        print(f"✅ {obs['color_name'].upper()}")
-                    self.color_history.append(obs['color'])
+            # A new obstacle only spawns on the player on strips of 1-2 LEDs
+            if self._obs_n > n and self._obs_pos[n] == self.player_pos:
+                i = n
+            n = self._obs_n
+
+        if i >= 0:
+            required_player = int(self._obs_player[i])
+            label = self._color_labels[self._obs_color_idx[i]]
+            if self.is_button_pressed(required_player, int(self._obs_button[i])):
+                if self.num_players > 1:
+                    self.log.info(f"✅ P{required_player + 1} {label}")
                 else:
-                    if self.num_players > 1:
-                        print(f"💥 P{required_player + 1} missed {obs['color_name'].upper()}!")
-                    else:
-                        print(f"💥 Missed {obs['color_name'].upper()}!")
-                    self.game_over()
-                    return
-
-        before_count = len(self.obstacles)
-        self.obstacles = [obs for obs in self.obstacles if obs['pos'] >= 0]
-        obstacles_passed = before_count - len(self.obstacles)
+                    self.log.info(f"✅ {label}")
+                self.color_history.append(int(self._obs_color_idx[i]))
+            else:
+                if self.num_players > 1:
+                    self.log.info(f"💥 P{required_player + 1} missed {label}!")
+                else:
+                    self.log.info(f"💥 Missed {label}!")
+                self.game_over()
+                return
 
         if obstacles_passed > 0:
+            self._obs_n = compact_obstacles(
+                self._obs_pos, self._obs_color, self._obs_button,
+                self._obs_player, self._obs_color_idx, obstacles_passed, n
+            )
+
             self.obstacles_passed += obstacles_passed
             self.score += 1
-            print(f"Score: {self.score}")
+            self.log.info(f"Score: {self.score}")
             self.update_difficulty()
 
     def cleanup(self):
         """Clean up resources"""
         self.running = False
+        self.post_frame(None)
+        self._show_thread.join()
         self.strip.fill((0, 0, 0))
         self.strip.show()
         pygame.quit()
 
     def signal_handler(self, signum, frame):
         """Handle termination signals"""
-        print(f"\n👋 Signal {signum} received, shutting down...")
+        self.log.info(f"\n👋 Signal {signum} received, shutting down...")
         self.cleanup()
         sys.exit(0)
 
+    def run_due_ticks(self):
+        """Run every tick that is due, catching up at most MAX_CATCH_UP_TICKS at once"""
+        monotonic_ns = time.monotonic_ns
+        update_obstacles = self.update_obstacles
+        playing = self.STATE_PLAYING
+
+        for _ in range(self.MAX_CATCH_UP_TICKS):
+            if self.state != playing or monotonic_ns() < self._next_tick_ns:
+                return
+            update_obstacles()
+            self._next_tick_ns += self._tick_ns
+
+        now = monotonic_ns()
+        if self._next_tick_ns <= now:
+            # Too far behind: drop the backlog instead of spiralling
+            self._next_tick_ns = now + self._tick_ns
+
+    def wait_for_event(self):
+        """Sleep until a controller event arrives or the next deadline is due"""
+        now = time.monotonic_ns()
+
+        if self.state == self.STATE_PLAYING:
+            deadline = self._next_tick_ns
+        elif self.state == self.STATE_PAUSED:
+            # Wake up exactly on the next blink phase
+            deadline = now + self.BLINK_NS - (now - self._pause_start_ns) % self.BLINK_NS
+        elif self.state == self.STATE_ANIMATING:
+            deadline = self._anim_next_ns
+        else:
+            # Nothing scheduled, sleep until input or a signal arrives
+            self.handle_event(pygame.event.wait())
+            return
+
+        delay_ns = deadline - now
+        if delay_ns <= 0:
+            # Already due, only collect what arrived for handle_input()
+            pygame.event.pump()
+            return
+
+        # Round up: waking early would only spin; 0 would block forever
+        self.handle_event(pygame.event.wait(-(-delay_ns // 1_000_000)))
+
+    def start_signal_wakeup(self):
+        """Make signals end a blocking pygame.event.wait()"""
+        # Python signal handlers only run once event.wait() returns. The
+        # wakeup fd gets a byte as soon as a signal arrives, a watcher
+        # thread turns it into a pygame event that ends the wait.
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        signal.set_wakeup_fd(write_fd)
+        threading.Thread(
+            target=self.forward_signal_wakeups, args=(read_fd,),
+            name='signal-wakeup', daemon=True
+        ).start()
+
+    def forward_signal_wakeups(self, read_fd):
+        """Post a wakeup event for every batch of signals written to read_fd"""
+        while os.read(read_fd, 64):
+            try:
+                pygame.event.post(pygame.event.Event(self.WAKEUP_EVENT))
+            except pygame.error:
+                # pygame was shut down by the signal handler
+                return
+
     def run(self):
         """Main game loop"""
         # Setup signal handlers for clean shutdown
         signal.signal(signal.SIGTERM, self.signal_handler)
         signal.signal(signal.SIGINT, self.signal_handler)
-
-        print("\n🎮 LED Runner")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("START = Pause / Resume / New game")
-        print("\nGame starting...")
-        print("CTRL+C to quit\n")
+        self.start_signal_wakeup()
+
+        self.log.info("\n🎮 LED Runner")
+        self.log.info("━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self.log.info("START = Pause / Resume / New game")
+        self.log.info("\nGame starting...")
+        self.log.info("CTRL+C to quit\n")
+
+        # Resolve the per-iteration calls once instead of on every pass
+        wait_for_event = self.wait_for_event
+        handle_input = self.handle_input
+        run_due_ticks = self.run_due_ticks
+        update_display = self.update_display
+        show_pause_display = self.show_pause_display
+        update_animation = self.update_animation
+        show_buffer = self.show_buffer
+        playing = self.STATE_PLAYING
+        paused = self.STATE_PAUSED
+        animating = self.STATE_ANIMATING
 
         try:
             while self.running:
-                self.handle_input()
+                # Wake on input or on the next deadline, whichever is first
+                wait_for_event()
+                handle_input()
+
+                state = self.state
+                if state == playing:
+                    run_due_ticks()
+                    # Only redraw after a tick or a button press changed something
+                    if self.state == playing and self._dirty:
+                        update_display()
 
-                if self.state == self.STATE_PLAYING:
-                    current_time = time.time()
-                    if current_time - self.last_update >= self.current_speed:
-                        self.update_obstacles()
-                        self.last_update = current_time
-                    if self.state == self.STATE_PLAYING:
-                        self.update_display()
+                elif state == paused:
+                    show_pause_display()
 
-                elif self.state == self.STATE_PAUSED:
-                    self.show_pause_display()
+                elif state == animating:
+                    update_animation()
 
-                elif self.state == self.STATE_GAME_OVER:
-                    pass
+                # STATE_GAME_OVER has nothing to render until input arrives
 
-                time.sleep(0.01)
+                # The helpers above only render, push at most one frame per iteration
+                show_buffer()
 
         except KeyboardInterrupt:
-            print(f"\n\n👋 Stopped. Score: {self.score}")
+            self.log.info(f"\n\n👋 Stopped. Score: {self.score}")
         finally:
             self.cleanup()
 
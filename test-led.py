@@ -32,9 +32,12 @@ gpio_map = {
     21: board.D21
 }
 
-if GPIO_PIN not in gpio_map:
+# GPIO 10 (SPI0 MOSI) drives the strip through the SPI peripheral
+SPI_PIN = 10
+
+if GPIO_PIN not in gpio_map and GPIO_PIN != SPI_PIN:
     print(f"❌ Invalid GPIO pin in config.json: {GPIO_PIN}")
-    print(f"   Use: 12, 13, 18 or 21")
+    print(f"   Use: 10 (SPI), 12, 13, 18 or 21")
     sys.exit(1)
 
 print(f"🔧 Initializing LED strip...")
@@ -43,17 +46,30 @@ print(f"   GPIO Pin: {GPIO_PIN}")
 print(f"   Brightness: {int(LED_BRIGHTNESS * 255)}/255")
 
 try:
-    strip = neopixel.NeoPixel(
-        gpio_map[GPIO_PIN],
-        LED_COUNT,
-        brightness=LED_BRIGHTNESS,
-        auto_write=False,
-        pixel_order=neopixel.GRB
-    )
+    if GPIO_PIN == SPI_PIN:
+        import neopixel_spi
+        strip = neopixel_spi.NeoPixel_SPI(
+            board.SPI(),
+            LED_COUNT,
+            brightness=LED_BRIGHTNESS,
+            auto_write=False,
+            pixel_order=neopixel_spi.GRB
+        )
+    else:
+        strip = neopixel.NeoPixel(
+            gpio_map[GPIO_PIN],
+            LED_COUNT,
+            brightness=LED_BRIGHTNESS,
+            auto_write=False,
+            pixel_order=neopixel.GRB
+        )
     print(f"✅ LED strip initialized on GPIO {GPIO_PIN}\n")
 except Exception as e:
     print(f"❌ Error initializing: {e}")
-    print(f"   Are you running the script with sudo?")
+    if GPIO_PIN == SPI_PIN:
+        print(f"   Is SPI enabled? (sudo raspi-config → Interface Options → SPI)")
+    else:
+        print(f"   Are you running the script with sudo?")
     sys.exit(1)
 
 try: